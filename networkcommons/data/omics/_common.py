@@ -107,13 +107,19 @@ def _download(url: str, path: str) -> None:
     _log(f'Utils: Finished downloading `{url}` to `{path}`.')
 
 
-def _maybe_download(url: str, **kwargs) -> str:
+def _url_cache_path(url: str) -> str:
 
-    url = url.format(**kwargs)
     cachedir = _conf.get('cachedir')
     md5 = hashlib.md5(url.encode()).hexdigest()
     fname = os.path.basename(urllib.parse.urlparse(url).path)
-    path = os.path.join(cachedir, f'{md5}-{fname}')
+
+    return os.path.join(cachedir, f'{md5}-{fname}')
+
+
+def _maybe_download(url: str, **kwargs) -> str:
+
+    url = url.format(**kwargs)
+    path = _url_cache_path(url)
     _log(f'Utils: Looking up in cache: `{url}` -> `{path}`.')
 
     if not os.path.exists(path):
@@ -25,6 +25,8 @@ __all__ = ['panacea_experiments', 'panacea_datatypes', 'panacea_tables', 'panace
 import pandas as pd
 import os
 import urllib.parse
+import importlib.util
+import concurrent.futures
 
 from . import _common
 
@@ -32,11 +34,47 @@ from networkcommons import _conf
 from networkcommons._session import _log
 
 
-def panacea_experiments(update=True) -> pd.DataFrame:
+_EXPS_CACHE: dict[str, pd.DataFrame] = {}
+
+# pyarrow is optional: if available, tables are cached as parquet
+_PARQUET = importlib.util.find_spec('pyarrow') is not None
+
+
+def _cache_path(name: str) -> str:
+
+    ext = 'parquet' if _PARQUET else 'pickle'
+
+    return os.path.join(_conf.get('pickle_dir'), f'{name}.{ext}')
+
+
+def _to_cache(df: pd.DataFrame, path: str) -> None:
+
+    if path.endswith('.parquet'):
+
+        df.to_parquet(path, compression='zstd')
+
+    else:
+
+        df.to_pickle(path)
+
+
+def _from_cache(path: str) -> pd.DataFrame:
+
+    if path.endswith('.parquet'):
+
+        return pd.read_parquet(path)
+
+    return pd.read_pickle(path)
+
+
+def panacea_experiments(update: bool = False) -> pd.DataFrame:
     """
     Table describing the experiments (drug-cell combinations) contained
     in the Panacea dataset and merging it with the presence of TF_scores.
 
+    The table is kept in memory after the first call, subsequent calls
+    return a copy of it unless `update` is True.
+
     Args:
         update (bool): Whether to update the dataframe by fetching new metadata.
         tf_scores_dir (str): Directory where TF_scores files are located.
@@ -45,7 +83,11 @@ def panacea_experiments(update=True) -> pd.DataFrame:
         Data frame with all drug-cell line combinations and TF_scores availability.
     """
 
-    path = os.path.join(_conf.get('pickle_dir'), 'panacea_exps.pickle')
+    path = _cache_path('panacea_exps')
+
+    if not update and path in _EXPS_CACHE:
+
+        return _EXPS_CACHE[path].copy()
 
     if update or not os.path.exists(path):
 
@@ -55,7 +97,7 @@ def panacea_experiments(update=True) -> pd.DataFrame:
 
         processed_dir = baseurl + '/processed'
 
-        file_legend[['cell', 'drug']] = file_legend['group'].str.split('_', expand=True)
+        file_legend[['cell', 'drug']] = file_legend['group'].str.split('_', n=1, expand=True)
         file_legend.drop(columns='sample_ID', inplace=True)
         file_legend.drop_duplicates(inplace=True)
         file_legend.reset_index(drop=True, inplace=True)
@@ -73,13 +115,15 @@ def panacea_experiments(update=True) -> pd.DataFrame:
 
         file_legend['tf_scores'] = file_legend['group'].apply(lambda x: x in tf_scores_groups)
 
-        file_legend.to_pickle(path)
+        _to_cache(file_legend, path)
 
 
     else:
-        file_legend = pd.read_pickle(path)
+        file_legend = _from_cache(path)
 
-    return file_legend
+    _EXPS_CACHE[path] = file_legend
+
+    return file_legend.copy()
 
 
 def panacea_datatypes() -> pd.DataFrame:
@@ -119,12 +163,40 @@ def panacea_tables(cell_line=None, drug=None, type='raw'):
         raise ValueError('Please specify cell line and drug.')
 
     if type == 'raw':
-        df_meta = _common._open(
-            _common._commons_url('panacea', table='metadata'),
-            df = {'sep': '\t'},
-        )
+        count_url = _common._commons_url('panacea', table='countdata')
+
+        # the count table is by far the larger download: if not cached yet,
+        # fetch it in the background while the metadata is retrieved;
+        # parsing the counts has to wait for the selected sample IDs
+        executor = None
+
+        if not os.path.exists(_common._url_cache_path(count_url)):
+
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            count_download = executor.submit(_common._maybe_download, count_url)
+
+        try:
 
-        df_meta[['cell', 'drug']] = df_meta['group'].str.split('_', expand=True)
+            df_meta = _common._open(
+                _common._commons_url('panacea', table='metadata'),
+                df = {'sep': '\t'},
+            )
+
+        except BaseException:
+
+            # report the error without waiting for the count table
+            if executor:
+
+                executor.shutdown(wait=False)
+
+            raise
+
+        if executor:
+
+            count_download.result()
+            executor.shutdown()
+
+        df_meta[['cell', 'drug']] = df_meta['group'].str.split('_', n=1, expand=True)
 
         if isinstance(cell_line, str):
             cell_line = [cell_line]
@@ -138,12 +210,15 @@ def panacea_tables(cell_line=None, drug=None, type='raw'):
         if drug is not None:
             df_meta = df_meta[df_meta['drug'].isin(drug)]
 
+        subset_cols = df_meta['sample_ID'].tolist()
+
+        # parse only the selected samples; `usecols` keeps the file's
+        # column order, hence the reindexing below
         df_count = _common._open(
-            _common._commons_url('panacea', table='countdata'),
-            df={'sep': '\t'},
+            count_url,
+            df={'sep': '\t', 'usecols': ['gene_symbol'] + subset_cols},
         )
 
-        subset_cols = df_meta['sample_ID'].tolist()
         df_count = df_count.loc[:, ['gene_symbol'] + subset_cols]
 
         return df_count, df_meta
@@ -1,3 +1,5 @@
+import importlib.util
+
 import pandas as pd
 import networkx as nx
 import numpy as np
@@ -6,6 +8,10 @@ import corneto.contrib.networkx as cn_nx
 from networkcommons._session import _log
 
 
+# pyarrow is optional: if available, it is used as a faster CSV parser
+_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
 def node_attrs_from_corneto(graph: cn.Graph) -> pd.DataFrame:
     """
     Extract node attributes from a corneto graph to a pandas dataframe.
@@ -115,7 +121,10 @@ def read_network_from_file(file_path,
         nx.Graph or nx.DiGraph: The network.
     """
 
-    network_df = pd.read_csv(file_path, sep=sep)
+    # the pyarrow engine supports only single character delimiters
+    single_char = isinstance(sep, str) and len(sep) == 1
+    engine = 'pyarrow' if _PYARROW and single_char else None
+    network_df = pd.read_csv(file_path, sep=sep, engine=engine)
 
     network = network_from_df(network_df,
                               source_col=source_col,
@@ -143,23 +152,24 @@ def network_from_df(network_df,
     """
     network_type = nx.DiGraph if directed else nx.Graph
 
-    if list(network_df.columns) == list([source_col, target_col]):
+    if list(network_df.columns) == [source_col, target_col]:
         network = nx.from_pandas_edgelist(network_df,
                                           source=source_col,
                                           target=target_col,
                                           create_using=network_type)
     else:
+        if ('weight' in network_df.columns and
+                (network_df['weight'] < 0).any()):
+            # derive signs on the whole column before building the graph
+            weight = network_df['weight']
+            network_df = network_df.assign(sign=np.where(weight >= 0, 1, -1),
+                                           weight=weight.abs())
+
         network = nx.from_pandas_edgelist(network_df,
                                           source=source_col,
                                           target=target_col,
                                           edge_attr=True,
                                           create_using=network_type)
-        if ('weight' in network_df.columns and
-                (network_df['weight'] < 0).any()):
-            for u, v, data in network.edges(data=True):
-                weight = data['weight']
-                data['sign'] = 1 if weight >= 0 else -1
-                data['weight'] = abs(weight)
 
     return network
 
@@ -177,10 +187,14 @@ def get_subnetwork(network, paths):
     """
     directed = nx.is_directed(network)
     subnetwork = nx.DiGraph() if directed else nx.Graph()
-    for path in paths:
-        for i in range(len(path) - 1):
-            edge_data = network.get_edge_data(path[i], path[i + 1])
-            subnetwork.add_edge(path[i], path[i + 1], **edge_data)
+
+    # edges shared by several paths are collected only once
+    edges = {
+        (u, v): network[u][v]
+        for path in paths
+        for u, v in zip(path, path[1:])
+    }
+    subnetwork.add_edges_from((u, v, data) for (u, v), data in edges.items())
 
     return subnetwork
 
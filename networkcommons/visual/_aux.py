@@ -14,6 +14,7 @@
 #
 
 from typing import List
+import functools as ft
 from networkcommons._session import _log
 import re
 
@@ -93,3 +94,21 @@ def adjust_node_name(node_name: str,
 
     # Return the modified node name, stripped of leading and trailing spaces, and _ characters
     return new_node_name.strip("_")
+
+
+@ft.lru_cache(maxsize=4096)
+def _adjust_node_name_cached(node_name: str,
+                             truncate: bool = False,
+                             wrap: bool = False,
+                             max_length: int = 8,
+                             wrap_length: int = 8) -> str:
+    """
+    Memoized `adjust_node_name` for the options that are hashable, used when
+    relabelling the same nodes over repeated visualizations.
+    """
+
+    return adjust_node_name(node_name,
+                            truncate=truncate,
+                            wrap=wrap,
+                            max_length=max_length,
+                            wrap_length=wrap_length)
@@ -21,12 +21,19 @@ from __future__ import annotations
 
 __all__  = ['get_styles', 'merge_styles', 'set_style_attributes']
 
+import functools as ft
+
 from networkcommons._session import _log
 
 
+@ft.lru_cache(maxsize = None)
 def get_styles():
     """
     Return a dictionary containing styles for different types of networks.
+
+    The dictionary is built only once and shared by all callers, hence it
+    must not be modified in place: use `merge_styles` to derive custom
+    styles from it, or copy it.
     """
     styles = {
         'default': {
@@ -36,6 +36,9 @@ from __future__ import annotations
 
 __all__ = ['NetworkVisualizerBase', 'NetworkXVisualizer']
 
+import io
+import copy
+
 import lazy_import
 import networkx as nx
 import matplotlib.pyplot as plt
@@ -45,6 +48,26 @@ from . import _styles
 from networkcommons._session import _log
 
 
+def _node_roles(source_dict, target_dict):
+    """
+    Role of the source and target nodes, as keys of the node styles.
+
+    Nodes that are both sources and targets are considered sources, nodes
+    missing from the result have the role 'other'.
+
+    Args:
+        source_dict (dict): Sources and perturbation signs, or None.
+        target_dict (dict): Targets and measurement signs, or None.
+
+    Returns:
+        dict: Node names mapped to 'sources' or 'targets'.
+    """
+    node_roles = dict.fromkeys(target_dict or (), 'targets')
+    node_roles.update(dict.fromkeys(source_dict or (), 'sources'))
+
+    return node_roles
+
+
 class NetworkVisualizerBase:
     """
     A base class for visualizing networks with basic styling options.
@@ -68,7 +91,9 @@ class NetworkVisualizerBase:
             network (nx.Graph): The network graph to visualize.
         """
         self.network = network
-        self.style = _styles.get_styles()['default']  # Basic style applied by default
+        # Basic style applied by default; copied, as the styles returned by
+        # `get_styles` are shared
+        self.style = copy.deepcopy(_styles.get_styles()['default'])
 
     def set_custom_style(self, custom_style=None):
         """
@@ -111,36 +136,39 @@ class NetworkVisualizerBase:
         A = nx.nx_agraph.to_agraph(self.network)
         A.graph_attr['ratio'] = '1.2'
 
-        sources = list(source_dict.keys())
-        targets = set(target_dict.keys())
+        source_style = self.style['nodes']['sources']
+        target_style = self.style['nodes']['targets']
+        other_style = self.style['nodes']['other']['default']
 
         for node in A.nodes():
             n = node.get_name()
-            if n in sources:
-                base_style = self.style['nodes']['sources']
-            elif n in targets:
-                base_style = self.style['nodes']['targets']
+            if n in source_dict:
+                base_style = source_style
+            elif n in target_dict:
+                base_style = target_style
             else:
-                base_style = self.style['nodes']['other']['default']
+                base_style = other_style
 
             _styles.set_style_attributes(node, base_style)
 
+        edges_style = self.style['edges']
+
         for edge in A.edges():
             u, v = edge
             edge_data = self.network.get_edge_data(u, v)
             if not edge_data:
                 _log(f"Edge data not found for edge {u} -> {v}.")
-                edge_style = self.style['edges']['default']
+                edge_style = edges_style['default']
             else:
                 if 'interaction' in edge_data:
                     edge_data['sign'] = edge_data.pop('interaction')
 
                 if edge_data['sign'] == 1 and is_sign_consistent:
-                    edge_style = self.style['edges']['positive']
+                    edge_style = edges_style['positive']
                 elif edge_data['sign'] == -1 and is_sign_consistent:
-                    edge_style = self.style['edges']['negative']
+                    edge_style = edges_style['negative']
                 else:
-                    edge_style = self.style['edges']['default']
+                    edge_style = edges_style['default']
 
             _styles.set_style_attributes(edge, edge_style)
 
@@ -180,7 +208,10 @@ class NetworkXVisualizer(NetworkVisualizerBase):
         """
         super().__init__(network)
         self.color_by = color_by
-        self.edge_colors = _styles.get_styles()['default']['edges']
+        # last laid out graph and its DOT source before layout, by layout program
+        self._layout_cache = {}
+        # copy, as `set_custom_edge_colors` updates it in place
+        self.edge_colors = copy.deepcopy(_styles.get_styles()['default']['edges'])
 
     def set_custom_edge_colors(self, custom_edge_colors):
         """
@@ -201,31 +232,29 @@ class NetworkXVisualizer(NetworkVisualizerBase):
         target_node_color = default_node_styles['targets']['fillcolor']
         default_color = default_node_styles['other']['default']['fillcolor']
 
-        for node in self.network.nodes:
-            node_data = self.network.nodes[node]
-            node_data['color'] = default_color
+        color_by_type = {"source": source_node_color, "target": target_node_color}
+        colors = {
+            node: color_by_type.get(node_type, default_color)
+            for node, node_type in self.network.nodes(data="type")
+        }
 
-            if node_data.get("type") == "source":
-                node_data['color'] = source_node_color
-            elif node_data.get("type") == "target":
-                node_data['color'] = target_node_color
+        nx.set_node_attributes(self.network, colors, 'color')
 
     def color_edges(self):
         """
         Colors edges based on a specified attribute. Uses colors from the style dictionary.
         """
         edge_colors = _styles.get_styles()['default']['edges']
-        for edge in self.network.edges():
-            u, v = edge
-            edge_data = self.network.get_edge_data(u, v)
-            if self.color_by in edge_data:
-                edge_style = edge_colors.get(edge_data[self.color_by], edge_colors['default'])
-                color = edge_style['color'] if isinstance(edge_style, dict) else edge_style
-            else:
-                color = edge_colors['default']['color'] if isinstance(edge_colors['default'], dict) \
-                    else edge_colors['default']
+        default_style = edge_colors['default']
+        default_color = default_style['color'] if isinstance(default_style, dict) else default_style
+
+        colors = dict.fromkeys(self.network.edges, default_color)
 
-            edge_data['color'] = color
+        for edge, key in nx.get_edge_attributes(self.network, self.color_by).items():
+            edge_style = edge_colors.get(key, default_style)
+            colors[edge] = edge_style['color'] if isinstance(edge_style, dict) else edge_style
+
+        nx.set_edge_attributes(self.network, colors, 'color')
 
     def adjust_node_labels(self,
                            wrap: bool = True,
@@ -243,11 +272,11 @@ class NetworkXVisualizer(NetworkVisualizerBase):
         """
         for node in self.network.nodes():
             node_data = self.network.nodes[node]
-            adjusted_name = _aux.adjust_node_name(node,
-                                                  truncate=truncate,
-                                                  wrap=wrap,
-                                                  max_length=max_length,
-                                                  wrap_length=wrap_length)
+            adjusted_name = _aux._adjust_node_name_cached(node,
+                                                          truncate=truncate,
+                                                          wrap=wrap,
+                                                          max_length=max_length,
+                                                          wrap_length=wrap_length)
             node_data['label'] = adjusted_name
 
 
@@ -257,7 +286,9 @@ class NetworkXVisualizer(NetworkVisualizerBase):
                                   prog='dot',
                                   custom_style=None,
                                   max_nodes=75,
-                                  wrap_names=True):
+                                  wrap_names=True,
+                                  force_rebuild=False,
+                                  _roles=None):
         """
         Visualizes the network using default styles.
 
@@ -269,6 +300,10 @@ class NetworkXVisualizer(NetworkVisualizerBase):
             custom_style (dict, optional): Custom style dictionary to apply.
             max_nodes (int, optional): Maximum number of nodes to visualize. Defaults to 75.
             wrap_names (bool, optional): Whether to wrap node names. Defaults to True.
+            force_rebuild (bool, optional): Compute the layout even if the same graph
+                with the same styles has been laid out before. Defaults to False.
+            _roles (dict, optional): Node roles, as returned by `_node_roles`,
+                if the caller already prepared them.
 
         Returns:
             A (pygraphviz.AGraph): The visualized network graph.
@@ -285,38 +320,42 @@ class NetworkXVisualizer(NetworkVisualizerBase):
         default_style = _styles.get_styles()['default']
         style = _styles.merge_styles(default_style, custom_style)
 
-        A = nx.nx_agraph.to_agraph(self.network)
-        A.graph_attr['ratio'] = '1.2'
-
         # Adjust node labels before visualization
         if wrap_names:
             self.adjust_node_labels(wrap=True, truncate=True)
 
-        if source_dict:
-            sources = set(source_dict.keys())
-        else:
-            sources = set()
-        if target_dict:
-            targets = set(target_dict.keys())
-        else:
-            targets = set()
+        A = nx.nx_agraph.to_agraph(self.network)
+        A.graph_attr['ratio'] = '1.2'
 
-        for node in A.nodes():
-            n = node.get_name()
-            if n in sources:
-                base_style = style['nodes']['sources']
-            elif n in targets:
-                base_style = style['nodes']['targets']
-            else:
-                base_style = style['nodes']['other']['default']
+        node_roles = _roles or _node_roles(source_dict, target_dict)
+
+        node_styles = {
+            'sources': style['nodes']['sources'],
+            'targets': style['nodes']['targets'],
+            'other': style['nodes']['other']['default'],
+        }
 
+        for node in A.nodes():
+            base_style = node_styles[node_roles.get(node.get_name(), 'other')]
             _styles.set_style_attributes(node, base_style)
 
+        edge_style = style['edges']['neutral']
+
         for edge in A.edges():
-            edge_style = style['edges']['neutral']
             _styles.set_style_attributes(edge, edge_style)
 
-        A.layout(prog=prog)
+        # the layout depends only on the program and the styled graph,
+        # an identical DOT source can reuse the previously computed layout
+        dot = A.string()
+        cached_dot, laid_out = self._layout_cache.get(prog, (None, None))
+
+        if force_rebuild or cached_dot != dot:
+            A.layout(prog=prog)
+            self._layout_cache[prog] = (dot, A.copy())
+        else:
+            A = laid_out.copy()
+            A.has_layout = True
+
         return A
 
     def visualize_network_sign_consistent(self,
@@ -324,7 +363,8 @@ class NetworkXVisualizer(NetworkVisualizerBase):
                                           target_dict,
                                           prog='dot',
                                           custom_style=None,
-                                          max_nodes=75):
+                                          max_nodes=75,
+                                          force_rebuild=False):
         """
         Visualizes the network considering sign consistency.
 
@@ -335,6 +375,8 @@ class NetworkXVisualizer(NetworkVisualizerBase):
             prog (str, optional): Layout program to use. Defaults to 'dot'.
             custom_style (dict, optional): Custom style dictionary to apply.
             max_nodes (int, optional): Maximum number of nodes to visualize. Defaults to 75.
+            force_rebuild (bool, optional): Compute the layout even if a cached one
+                is available. Defaults to False.
         Returns:
             A (pygraphviz.AGraph): The visualized network graph.
         """
@@ -350,53 +392,58 @@ class NetworkXVisualizer(NetworkVisualizerBase):
         default_style = _styles.get_styles()['sign_consistent']
         style = _styles.merge_styles(default_style, custom_style)
 
-        A = self.visualize_network_default(source_dict, target_dict, prog=prog, custom_style=style, max_nodes=max_nodes)
-
-        if source_dict:
-            sources = set(source_dict.keys())
-        else:
-            sources = set()
-        if target_dict:
-            targets = set(target_dict.keys())
-        else:
-            targets = set()
+        node_roles = _node_roles(source_dict, target_dict)
+        targets = target_dict or {}
+
+        A = self.visualize_network_default(source_dict,
+                                           target_dict,
+                                           prog=prog,
+                                           custom_style=style,
+                                           max_nodes=max_nodes,
+                                           force_rebuild=force_rebuild,
+                                           _roles=node_roles)
+
+        # (positive, negative) consistency styles by node type
+        consistent_styles = {
+            nodes_type: (
+                style['nodes'][nodes_type].get('positive_consistent'),
+                style['nodes'][nodes_type].get('negative_consistent'),
+            )
+            for nodes_type in ('sources', 'targets', 'other')
+        }
 
         for node in A.nodes():
             n = node.get_name()
             condition_style = None
-            sign_value = target_dict.get(n, 1)
-
-            if n in sources:
-                nodes_type = "sources"
-            elif n in targets:
-                nodes_type = "targets"
-            else:
-                nodes_type = "other"
+            sign_value = targets.get(n, 1)
+            nodes_type = node_roles.get(n, 'other')
 
             if sign_value > 0:
-                condition_style = style['nodes'][nodes_type].get('positive_consistent')
+                condition_style = consistent_styles[nodes_type][0]
             elif sign_value < 0:
-                condition_style = style['nodes'][nodes_type].get('negative_consistent')
+                condition_style = consistent_styles[nodes_type][1]
 
             if condition_style:
                 _styles.set_style_attributes(node, {}, condition_style)
 
+        # `interaction` takes precedence over `sign`
+        signs = nx.get_edge_attributes(self.network, 'sign')
+        signs.update(nx.get_edge_attributes(self.network, 'interaction'))
+
+        edges_style = style['edges']
+
         for edge in A.edges():
             u, v = edge
-            edge_data = self.network.get_edge_data(u, v)
-            if not edge_data:
+            sign = signs.get((u, v))
+            if sign is None:
                 _log(f"Edge data not found for edge {u} -> {v}.")
-                edge_style = style['edges']['default']
+                edge_style = edges_style['default']
+            elif sign == 1:
+                edge_style = edges_style['positive']
+            elif sign == -1:
+                edge_style = edges_style['negative']
             else:
-                if 'interaction' in edge_data:
-                    edge_data['sign'] = edge_data.pop('interaction')
-
-                if edge_data['sign'] == 1:
-                    edge_style = style['edges']['positive']
-                elif edge_data['sign'] == -1:
-                    edge_style = style['edges']['negative']
-                else:
-                    edge_style = style['edges']['neutral']
+                edge_style = edges_style['neutral']
 
             _styles.set_style_attributes(edge, edge_style)
 
@@ -427,7 +474,6 @@ class NetworkXVisualizer(NetworkVisualizerBase):
         if network_type == 'sign_consistent':
             return self.visualize_network_sign_consistent(source_dict, target_dict, prog, custom_style, max_nodes)
         else:
-            default_style = _styles.get_styles().get(network_type, 'default')
             return self.visualize_network_default(source_dict, target_dict, prog, custom_style, max_nodes)
 
     def visualize(self,
@@ -465,21 +511,27 @@ class NetworkXVisualizer(NetworkVisualizerBase):
 
         # Highlight specific nodes if provided
         if highlight_nodes:
+            highlight_nodes = set(highlight_nodes)
+            highlight_color = style['highlight_color'] if style and 'highlight_color' in style else \
+                self.style['nodes']['other']['default']['fillcolor']
             for node in A.nodes():
                 if node in highlight_nodes:
-                    highlight_color = style['highlight_color'] if style and 'highlight_color' in style else \
-                        self.style['nodes']['other']['default']['fillcolor']
                     A.get_node(node).attr['fillcolor'] = highlight_color
                     A.get_node(node).attr['style'] = 'filled'
 
-        # Save or render the plot
+        # Draw from the positions computed by `A.layout` if available,
+        # passing `prog` to `draw` would run the layout again
+        draw_prog = None if A.has_layout else prog
+
+        # Save or render the plot; saving goes straight through graphviz,
+        # matplotlib is only involved for rendering
         if render:
-            img_data = A.draw(format='png', prog=prog)  # Get image data in-memory
-            plt.imshow(plt.imread(img_data))  # Render the image from the in-memory data
+            img_data = A.draw(format='png', prog=draw_prog)  # Get image data in-memory
+            plt.imshow(plt.imread(io.BytesIO(img_data), format='png'))  # Render the image from the in-memory data
             plt.axis('off')
             plt.show()
         elif output_file:
-            A.draw(output_file, format='png', prog='dot')
+            A.draw(output_file, format='png', prog=draw_prog)
             _log(f"Network visualization saved to {output_file}.")
             print(f"Network visualization saved to {output_file}.")
         else:
@@ -53,7 +53,7 @@ class YFilesVisualizer:
         styles (dict): A dictionary of styles for visualizing nodes and edges.
 
     Methods:
-        __init__(network): Initializes the visualizer with a network graph.
+        __init__(network, copy): Initializes the visualizer with a network graph.
         visualize(graph_layout="Organic", directed=True): Visualizes the network with a specified layout and direction.
         vis_comparison(int_comparison, node_comparison, graph_layout, directed): Visualizes network comparison data with specific layout and direction.
         custom_edge_color_mapping(edge): Custom function to map edge colors.
@@ -62,14 +62,18 @@ class YFilesVisualizer:
         custom_label_styles_mapping(node): Custom function to map node label styles.
     """
 
-    def __init__(self, network):
+    def __init__(self, network, copy=False):
         """
         Initializes the visualizer with a network graph and default styles.
 
         Args:
             network (nx.Graph): The network graph to visualize.
+            copy (bool, optional): Store a copy of the network instead of the
+                network itself. The visualizer never modifies the network, a
+                copy is only needed if the caller changes it later but wants
+                to visualize its current state. Defaults to False.
         """
-        self.network = network.copy()
+        self.network = network.copy() if copy else network
         self.styles = _yfiles_styles.get_styles()
 
     def visualize(self, graph_layout="Organic", directed=True):
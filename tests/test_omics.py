@@ -8,6 +8,7 @@ from networkcommons.data import omics
 
 from unittest.mock import patch, MagicMock, mock_open
 import zipfile
+import threading
 import bs4
 
 import responses
@@ -334,6 +335,8 @@ def test_decryptm_experiment_no_dataset(mock_decryptm_datasets):
 
 # FILE: omics/_panacea.py
 
+@patch.dict('networkcommons.data.omics._panacea._EXPS_CACHE', clear=True)
+@patch('networkcommons.data.omics._panacea._PARQUET', False)
 @patch('urllib.request.urlopen')
 @patch('pandas.read_csv')
 @patch('os.path.exists', return_value=False)
@@ -383,6 +386,8 @@ def test_panacea_experiments(mock_to_pickle, mock_path_exists, mock_read_csv, mo
     mock_to_pickle.assert_called_once()
 
 
+@patch.dict('networkcommons.data.omics._panacea._EXPS_CACHE', clear=True)
+@patch('networkcommons.data.omics._panacea._PARQUET', False)
 @patch('networkcommons.data.omics._panacea._common._baseurl', return_value='http://example.com')
 @patch('pandas.read_pickle')
 @patch('os.path.exists', return_value=True)
@@ -397,6 +402,42 @@ def test_panacea_experiments_cached(mock_path_exists, mock_read_pickle, mock_bas
     assert result_df.equals(mock_df)
 
 
+@patch.dict('networkcommons.data.omics._panacea._EXPS_CACHE', clear=True)
+@patch('networkcommons.data.omics._panacea._PARQUET', False)
+@patch('networkcommons.data.omics._panacea._common._baseurl', return_value='http://example.com')
+@patch('pandas.read_pickle')
+@patch('os.path.exists', return_value=True)
+def test_panacea_experiments_memory_cache(mock_path_exists, mock_read_pickle, mock_baseurl):
+    mock_df = pd.DataFrame({'cell': ['A', 'C'], 'drug': ['B', 'D']})
+    mock_read_pickle.return_value = mock_df
+
+    first = omics.panacea_experiments()
+    first.loc[0, 'cell'] = 'X'
+    second = omics.panacea_experiments()
+
+    # the pickle is read only once, and callers get independent copies
+    mock_read_pickle.assert_called_once()
+    assert second.equals(mock_df)
+
+
+@patch.dict('networkcommons.data.omics._panacea._EXPS_CACHE', clear=True)
+@patch('networkcommons.data.omics._panacea._PARQUET', True)
+@patch('networkcommons.data.omics._panacea._common._baseurl', return_value='http://example.com')
+@patch('pandas.read_pickle')
+@patch('pandas.read_parquet')
+@patch('os.path.exists', return_value=True)
+def test_panacea_experiments_parquet(mock_path_exists, mock_read_parquet, mock_read_pickle, mock_baseurl):
+    mock_df = pd.DataFrame({'cell': ['A', 'C'], 'drug': ['B', 'D']})
+    mock_read_parquet.return_value = mock_df
+
+    result_df = omics.panacea_experiments(update=False)
+
+    mock_read_parquet.assert_called_once()
+    assert mock_read_parquet.call_args.args[0].endswith('panacea_exps.parquet')
+    mock_read_pickle.assert_not_called()
+    assert result_df.equals(mock_df)
+
+
 def test_panacea_datatypes():
     dtypes = omics.panacea_datatypes()
 
@@ -412,6 +453,81 @@ def test_panacea_datatypes():
     pd.testing.assert_frame_equal(dtypes, expected_df)
 
 
+@patch('networkcommons.data.omics._panacea._common._url_cache_path')
+@patch('networkcommons.data.omics._panacea._common._maybe_download')
+@patch('networkcommons.data.omics._panacea._common._open')
+def test_panacea_tables_count_usecols(mock_open, mock_download, mock_cache_path, tmp_path):
+    mock_cache_path.return_value = str(tmp_path / 'countdata.tsv')
+    mock_meta = pd.DataFrame({
+        'sample_ID': ['sample1', 'sample2', 'sample3'],
+        'group': ['cell1_drug1', 'cell1_drug2', 'cell2_drug1'],
+    })
+    mock_count = pd.DataFrame({
+        'gene_symbol': ['gene1', 'gene2'],
+        'sample1': [100, 200],
+        'sample3': [100, 200],
+    })
+    mock_open.side_effect = [mock_meta, mock_count]
+
+    df_count, df_meta = omics.panacea_tables(drug='drug1', type='raw')
+
+    # only the selected samples are parsed from the count table
+    # the count table is downloaded while the metadata is being opened
+    mock_download.assert_called_once_with(mock_open.call_args_list[1].args[0])
+    count_kwargs = mock_open.call_args_list[1].kwargs['df']
+    assert count_kwargs['usecols'] == ['gene_symbol', 'sample1', 'sample3']
+    assert df_count.columns.tolist() == ['gene_symbol', 'sample1', 'sample3']
+
+
+@patch('networkcommons.data.omics._panacea._common._url_cache_path')
+@patch('networkcommons.data.omics._panacea._common._maybe_download')
+@patch('networkcommons.data.omics._panacea._common._open')
+def test_panacea_tables_count_cached(mock_open, mock_download, mock_cache_path, tmp_path):
+    count_path = tmp_path / 'countdata.tsv'
+    count_path.touch()
+    mock_cache_path.return_value = str(count_path)
+    mock_meta = pd.DataFrame({
+        'sample_ID': ['sample1'],
+        'group': ['cell1_drug1'],
+    })
+    mock_count = pd.DataFrame({
+        'gene_symbol': ['gene1', 'gene2'],
+        'sample1': [100, 200],
+    })
+    mock_open.side_effect = [mock_meta, mock_count]
+
+    omics.panacea_tables(type='raw')
+
+    # no background download if the count table is already in the cache
+    mock_download.assert_not_called()
+
+
+@patch('networkcommons.data.omics._panacea._common._url_cache_path')
+@patch('networkcommons.data.omics._panacea._common._maybe_download')
+@patch('networkcommons.data.omics._panacea._common._open')
+def test_panacea_tables_meta_error(mock_open, mock_download, mock_cache_path, tmp_path):
+    mock_cache_path.return_value = str(tmp_path / 'countdata.tsv')
+    release = threading.Event()
+    finished = threading.Event()
+
+    def slow_download(url):
+        release.wait(10)
+        finished.set()
+
+    mock_download.side_effect = slow_download
+    mock_open.side_effect = OSError('metadata unavailable')
+
+    try:
+        # the error is raised before the count table download completes
+        with pytest.raises(OSError, match='metadata unavailable'):
+            omics.panacea_tables(type='raw')
+
+        assert not finished.is_set()
+
+    finally:
+        release.set()
+
+
 @patch('pandas.read_csv')
 @patch('networkcommons.data.omics._panacea._common._baseurl', return_value='http://example.com')
 def test_panacea_tables_diffexp(mock_baseurl, mock_read_csv):
@@ -431,9 +547,10 @@ def test_panacea_tables_diffexp(mock_baseurl, mock_read_csv):
     assert 'pvalue' in result_df.columns
 
 
+@patch('networkcommons.data.omics._panacea._common._maybe_download')
 @patch('networkcommons.data.omics._panacea._common._open')
 @patch('networkcommons.data.omics._panacea._common._baseurl', return_value='http://example.com')
-def test_panacea_tables_convert_to_list(mock_baseurl, mock_open):
+def test_panacea_tables_convert_to_list(mock_baseurl, mock_open, mock_download):
     # Mock the metadata
     mock_meta = pd.DataFrame({
         'sample_ID': ['sample1', 'sample2', 'sample3', 'sample4', 'sample5', 'sample6'],
@@ -535,9 +652,10 @@ def test_panacea_tables_value_error():
         omics.panacea_tables(type='diffexp')
 
 
+@patch('networkcommons.data.omics._panacea._common._maybe_download')
 @patch('networkcommons.data.omics._panacea._common._open')
 @patch('networkcommons.data.omics._panacea._common._baseurl', return_value='http://example.com')
-def test_panacea_tables_raw(mock_baseurl, mock_open):
+def test_panacea_tables_raw(mock_baseurl, mock_open, mock_download):
     cell_line = 'CellLine1'
     drug = 'Drug1'
     data_type = 'raw'
@@ -113,6 +113,32 @@ def test_read_network_from_file():
         mock_network_from_df.assert_called_once()
 
 
+def test_read_network_from_file_multichar_sep():
+    with patch('pandas.read_csv') as mock_read_csv, patch('networkcommons.utils.network_from_df'):
+        mock_read_csv.return_value = pd.DataFrame({'source': ['a'], 'target': ['b']})
+        utils.read_network_from_file('dummy_path', sep='::')
+        # pyarrow can not parse multi character delimiters
+        assert mock_read_csv.call_args.kwargs['engine'] is None
+
+
+@patch('networkcommons.utils._PYARROW', True)
+def test_read_network_from_file_pyarrow():
+    with patch('pandas.read_csv') as mock_read_csv, patch('networkcommons.utils.network_from_df'):
+        mock_read_csv.return_value = pd.DataFrame({'source': ['a'], 'target': ['b']})
+        utils.read_network_from_file('dummy_path')
+        assert mock_read_csv.call_args.kwargs['engine'] == 'pyarrow'
+
+
+@patch('networkcommons.utils._PYARROW', True)
+def test_read_network_from_file_sniff_sep():
+    with patch('pandas.read_csv') as mock_read_csv, patch('networkcommons.utils.network_from_df'):
+        mock_read_csv.return_value = pd.DataFrame({'source': ['a'], 'target': ['b']})
+        utils.read_network_from_file('dummy_path', sep=None)
+        # delimiter sniffing is not supported by pyarrow
+        assert mock_read_csv.call_args.kwargs['sep'] is None
+        assert mock_read_csv.call_args.kwargs['engine'] is None
+
+
 def test_network_from_df():
     df = pd.DataFrame({'source': ['a'], 'target': ['b'], 'sign': [1]})
     result = utils.network_from_df(df)
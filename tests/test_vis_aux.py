@@ -1,5 +1,5 @@
 import pytest
-from networkcommons.visual._aux import adjust_node_name
+from networkcommons.visual._aux import adjust_node_name, _adjust_node_name_cached
 
 
 def test_replace_colon():
@@ -113,3 +113,11 @@ def test_leading_trailing_underscores_trimmed():
         "___node___",
         remove_strings=[]
     ) == "node"
+
+
+def test_cached_matches_uncached():
+    # Test the memoized variant gives the same result as adjust_node_name
+    kwargs = dict(truncate=True, wrap=True, max_length=6, wrap_length=6)
+    expected = adjust_node_name("node:with-special", **kwargs)
+    assert _adjust_node_name_cached("node:with-special", **kwargs) == expected
+    assert _adjust_node_name_cached("node:with-special", **kwargs) == expected
@@ -1,8 +1,11 @@
+import io
+
 import pytest
 from unittest.mock import patch, MagicMock
 import networkx as nx
 from networkcommons.visual import NetworkXVisualizer, NetworkVisualizerBase
 from networkcommons.visual import _styles
+from networkcommons.visual import _vis_networkx
 
 import matplotlib
 # Set the matplotlib backend to 'Agg' for headless environments (like GitHub Actions)
@@ -108,6 +111,19 @@ def test_network_visualizer_sign_consistent(mock_layout, mock_set_style_attribut
     mock_layout.assert_called_once()
 
 
+@patch('pygraphviz.AGraph.layout')
+def test_network_visualizer_sign_consistent_edge_styles(mock_layout, sample_network):
+    visualizer = NetworkXVisualizer(sample_network)
+    graph = visualizer.visualize_network_sign_consistent({'1': 1}, {'5': -1})
+    edges_style = _styles.get_styles()['sign_consistent']['edges']
+
+    for u, v, interaction in sample_network.edges(data='interaction'):
+        expected = edges_style['positive' if interaction == 1 else 'negative']
+        edge = graph.get_edge(u, v)
+        for attr, value in expected.items():
+            assert str(edge.attr[attr]) == str(value)
+
+
 @patch('networkcommons.visual._vis_networkx._log')
 @patch('networkcommons.visual._vis_networkx.plt.imshow')
 @patch('networkcommons.visual._vis_networkx.plt.imread')  # Mock imread
@@ -127,6 +143,11 @@ def test_network_visualizer_render(mock_show, mock_imread, mock_imshow, mock_log
     # Call the visualize method with render=True
     visualizer.visualize(source_dict, target_dict, render=True)
 
+    # The PNG data is decoded from memory, with its format given explicitly
+    image, = mock_imread.call_args.args
+    assert isinstance(image, io.BytesIO)
+    assert mock_imread.call_args.kwargs == {'format': 'png'}
+
     # Check if imshow was called with the mock image data
     mock_imshow.assert_called_once_with(mock_img_data)
 
@@ -141,7 +162,8 @@ def test_network_visualizer_save_plot(mock_draw, mock_log, sample_network, ):
     source_dict = {str(1): 1}
     target_dict = {str(5): -1}
     visualizer.visualize(source_dict, target_dict, output_file='test_plot.png')
-    mock_draw.assert_called_once_with('test_plot.png', format='png', prog='dot')
+    # the layout computed by the visualizer is reused for drawing
+    mock_draw.assert_called_once_with('test_plot.png', format='png', prog=None)
     mock_log.assert_called_once_with("Network visualization saved to test_plot.png.")
 
 
@@ -158,6 +180,32 @@ def test_network_visualizer_default_custom_style(mock_layout, mock_set_style_att
     mock_layout.assert_called_once_with(prog='dot')
 
 
+@patch('pygraphviz.AGraph.layout')
+def test_network_visualizer_layout_cache(mock_layout, sample_network):
+    visualizer = NetworkXVisualizer(sample_network)
+    visualizer.visualize_network_default({'1': 1}, {'5': -1})
+    graph = visualizer.visualize_network_default({'1': 1}, {'5': -1})
+    mock_layout.assert_called_once_with(prog='dot')
+    assert graph.has_layout
+    assert set(graph.nodes()) == set(sample_network.nodes())
+
+    visualizer.visualize_network_default({'1': 1}, {'5': -1}, prog='neato')
+    visualizer.visualize_network_default({'1': 1}, {'5': -1}, force_rebuild=True)
+    assert mock_layout.call_count == 3
+
+    # only the last layout is kept for each program
+    visualizer.visualize_network_default({'1': 1}, {'5': -1}, custom_style={'edges': {'neutral': {'color': 'red'}}})
+    visualizer.visualize_network_default({'1': 1}, {'5': -1})
+    assert mock_layout.call_count == 5
+    assert set(visualizer._layout_cache) == {'dot', 'neato'}
+
+
+def test_node_roles():
+    node_roles = _vis_networkx._node_roles({'1': 1, '3': -1}, {'3': 1, '5': -1})
+    assert node_roles == {'1': 'sources', '3': 'sources', '5': 'targets'}
+    assert _vis_networkx._node_roles(None, None) == {}
+
+
 @patch('networkcommons.visual._styles.set_style_attributes')
 def test_network_visualizer_edge_coloring(mock_set_style_attributes, sample_network):
     visualizer = NetworkXVisualizer(sample_network)
@@ -1,4 +1,6 @@
 import pytest
+import networkx as nx
+from networkcommons.visual import NetworkXVisualizer
 from networkcommons.visual._styles import get_styles, set_style_attributes, merge_styles
 
 
@@ -44,6 +46,21 @@ def test_get_styles():
                'color'] == '#33a02c', "Unexpected color for 'sign_consistent.edges.positive'."
 
 
+def test_get_styles_copy():
+    # modifying a visualizer's style does not affect the defaults
+    visualizer = NetworkXVisualizer(nx.DiGraph([('a', 'b')]))
+    visualizer.style['nodes']['sources']['fillcolor'] = 'red'
+    visualizer.edge_colors['positive']['color'] = 'red'
+
+    styles = get_styles()
+    assert styles['default']['nodes']['sources']['fillcolor'] != 'red'
+    assert styles['default']['edges']['positive']['color'] != 'red'
+
+    other = NetworkXVisualizer(nx.DiGraph([('a', 'b')]))
+    assert other.style['nodes']['sources']['fillcolor'] != 'red'
+    assert other.edge_colors['positive']['color'] != 'red'
+
+
 def test_set_style_attributes():
     item = MockItem()
     base_style = {'color': 'blue', 'shape': 'circle'}
@@ -18,6 +18,13 @@ class TestYFilesVisualizer(unittest.TestCase):
         # Create a YFilesVisualizer instance
         self.visualizer = YFilesVisualizer(self.network)
 
+    def test_init_copy(self):
+        self.assertIs(self.visualizer.network, self.network)
+
+        visualizer = YFilesVisualizer(self.network, copy=True)
+        self.assertIsNot(visualizer.network, self.network)
+        self.assertEqual(list(visualizer.network.edges), list(self.network.edges))
+
     @patch('networkcommons.visual._vis_yfiles.yfiles.GraphWidget')
     def test_visualize(self, mock_graph_widget):
         # Test the visualize method